@@ -1,13 +1,18 @@
 #!/usr/bin/env python
 
 import os
+import ast
 from setuptools import setup, find_packages
 
 HERE = os.path.abspath(os.path.dirname(__file__))
 
-about = {}
+# Read the version info statically, without executing the module
 with open(os.path.join(HERE, "skill_sdk", "__version__.py")) as f:
-    exec(f.read(), about)
+    about = {
+        node.targets[0].id: ast.literal_eval(node.value)
+        for node in ast.parse(f.read()).body
+        if isinstance(node, ast.Assign)
+    }
 
 
 setup(
@@ -75,6 +80,5 @@ setup(
         ],
     },
     entry_points={"console_scripts": ["vs = skill_sdk.__main__:main"]},
-    setup_requires=["wheel"],
     python_requires=">=3.7",
 )
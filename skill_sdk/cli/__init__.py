@@ -9,6 +9,7 @@
 
 """CLI: utility functions"""
 
+import os
 import sys
 import argparse
 import logging
@@ -73,7 +74,7 @@ def import_module_app(
     path = pathlib.Path(module_str)
 
     # Append current directory to sys.path
-    cwd = pathlib.Path("").absolute().__str__()
+    cwd = os.getcwd()
     if cwd not in sys.path:
         sys.path.append(cwd)
 
@@ -81,11 +82,12 @@ def import_module_app(
         module = importlib.import_module(path.stem)
     elif path.is_dir():
         module = importlib.import_module(module_str)
-        [
-            importlib.import_module("." + _.stem, _.parent.name)
-            for _ in path.iterdir()
-            if _.is_file() and _.suffix == ".py"
-        ]
+        with os.scandir(path) as entries:
+            for entry in entries:
+                stem, suffix = os.path.splitext(entry.name)
+                name = f"{path.name}.{stem}"
+                if suffix == ".py" and name not in sys.modules and entry.is_file():
+                    importlib.import_module(name)
     else:
         module = importlib.import_module(module_str)
 
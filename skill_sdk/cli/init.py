@@ -11,9 +11,7 @@
 
 import sys
 import argparse
-import pkg_resources
 from pathlib import Path
-from distutils.dir_util import copy_tree
 
 
 def execute(args: argparse.Namespace) -> None:
@@ -23,6 +21,7 @@ def execute(args: argparse.Namespace) -> None:
     :param args:
     :return:
     """
+    from distutils.dir_util import copy_tree
     import questionary
 
     # Projects folder path
@@ -48,7 +47,7 @@ def execute(args: argparse.Namespace) -> None:
         if not confirm:
             sys.exit("Exiting...")
 
-    scaffold_path = pkg_resources.resource_filename(__name__, "scaffold")
+    scaffold_path = Path(__file__).parent / "scaffold"
     copy_tree(scaffold_path.__str__(), path.__str__())
     print(f"Project initialized at {repr(path.absolute())}.")
 
@@ -229,6 +229,9 @@ class Settings(BaseSettings):
 
     REQUESTS_TIMEOUT: float = 5
 
+    # Maximal number of threads running synchronous intent handlers
+    EXECUTOR_MAX_WORKERS: int = 100
+
     #
     # Logging
     #
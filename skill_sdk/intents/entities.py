@@ -45,6 +45,24 @@ def get_entity(entities: List[Any]) -> Optional[Any]:
     )
 
 
+@functools.lru_cache(maxsize=64)
+def _gettz(name: Text) -> Optional[datetime.tzinfo]:
+    """Timezone lookup cache: devices report the same few timezones over and over"""
+    return gettz(name)
+
+
+def cached_gettz(name: Optional[Text]) -> Optional[datetime.tzinfo]:
+    """
+    Get timezone by name (the lookups are cached)
+
+        empty name resolves to local timezone (depends on "TZ" environment) and is not cached
+
+    :param name:
+    :return:
+    """
+    return _gettz(name) if name else gettz(name)
+
+
 @functools.singledispatch
 def to_datetime(value) -> datetime.datetime:
     """Parse datetime string"""
@@ -142,12 +160,13 @@ class TimeRange:
         @throws:        OverflowError in open-end datetime case
         """
 
+        step = datetime.timedelta(**{frame: 1})
         current = self.begin or datetime.datetime.now()
         end = self.end or datetime.datetime.max
 
         while current <= end:
             yield current
-            current += datetime.timedelta(**{frame: 1})
+            current += step
 
     def __repr__(self):
         return f'<TimeRange begin="{self.begin}" end="{self.end}">'
@@ -169,7 +188,7 @@ class TimeSet:
 
     def __init__(self, timex: str, tz=tzutc()):
         if not isinstance(tz, datetime.tzinfo):
-            tz = gettz(tz)
+            tz = cached_gettz(tz)
 
         self.tz = tz
         self.timex = timex
@@ -284,6 +303,16 @@ class AttributeV2(CamelModel, Generic[T]):
         super().__init__(**__value)
 
 
+# Conversion functions for types that cannot be simply called with a string value
+CONVERSION_TABLE: Dict[Any, Callable] = {
+    datetime.timedelta: to_timedelta,
+    datetime.datetime: to_datetime,
+    datetime.date: to_date,
+    datetime.time: to_time,
+    bool: on_off_to_boolean,
+}
+
+
 def converter(to_type):
     """
     Returns conversion function
@@ -291,17 +320,13 @@ def converter(to_type):
     :param to_type: type or callable
     :return:
     """
+    # Subclasses (e.g. `datetime.datetime` patched by `util.mock_datetime_now`) are looked up by MRO
+    for cls in getattr(to_type, "__mro__", (to_type,)):
+        conversion_func = CONVERSION_TABLE.get(cls)
+        if conversion_func is not None:
+            return conversion_func
 
-    conversion_table = {
-        datetime.timedelta: to_timedelta,
-        datetime.datetime: to_datetime,
-        datetime.date: to_date,
-        datetime.time: to_time,
-        bool: on_off_to_boolean,
-    }
-
-    conversion_func = to_type if callable(to_type) else lambda a: a
-    return conversion_table.get(to_type, conversion_func)
+    return to_type if callable(to_type) else lambda a: a
 
 
 def convert(value: str, to_type: T = None) -> T:
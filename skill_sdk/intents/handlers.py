@@ -67,9 +67,7 @@ async def invoke(handler: AnyFunc, request: Request) -> Response:
 
     with RequestContextVar(request=request):
         logger.debug(
-            "Calling intent %s with handler: %s",
-            repr(request.context.intent),
-            repr(handler),
+            "Calling intent %r with handler: %r", request.context.intent, handler
         )
 
         if inspect.iscoroutinefunction(handler):
@@ -79,7 +77,7 @@ async def invoke(handler: AnyFunc, request: Request) -> Response:
 
         result = _enrich(response)
 
-        logger.debug("Intent call result: %s", repr(result))
+        logger.debug("Intent call result: %r", result)
         return result
 
 
@@ -299,14 +297,14 @@ def _parse_and_call(
     if isinstance(request, Request):
         # Proceed with skill invoke request if first parameter is invoke request
         kw = _parse_request(request, parameters)
-        logger.debug("Collected arguments: %s", repr(kw))
+        logger.debug("Collected arguments: %r", kw)
 
         ba = signature.bind(**kw)
         arguments = {
             name: converters[name](value) for name, value in ba.arguments.items()
         }
 
-        logger.debug("Converted arguments to: %s", repr(arguments))
+        logger.debug("Converted arguments to: %r", arguments)
         ba.arguments.update(arguments)
 
         # raises EntityValueException if not silent mode
@@ -332,29 +330,18 @@ def _parse_and_call(
 def _log_and_call(message: Text, func: Callable, *args, **kwargs):
     """Helper to log debug message and call inner function"""
 
-    logger.debug(
-        "%s: calling %s with: %s, %s",
-        message,
-        repr(func.__name__),
-        repr(args),
-        repr(kwargs),
-    )
+    logger.debug("%s: calling %r with: %r, %r", message, func.__name__, args, kwargs)
     return func(*args, **kwargs)
 
 
 def _parse_errors(arguments: Dict[Text, Any], silent: bool = True):
-    """Extract type/value conversion exceptions"""
-    errors = next(
-        iter(
-            (name, ex)
-            for name, ex in arguments.items()
-            if isinstance(ex, EntityValueException)
-        ),
-        (),
-    )
-    if errors and not silent:
-        raise errors[1]
-    return errors
+    """Extract the first type/value conversion exception"""
+    for name, ex in arguments.items():
+        if isinstance(ex, EntityValueException):
+            if not silent:
+                raise ex
+            return name, ex
+    return ()
 
 
 def _as_attributes(attrs_v2: List[entities.AttributeV2]) -> List[Any]:
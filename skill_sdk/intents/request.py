@@ -22,12 +22,17 @@ from pydantic import Field
 from skill_sdk.__version__ import __spi_version__
 from skill_sdk.util import CamelModel
 from skill_sdk.intents import AttributeV2
+from skill_sdk.intents.entities import cached_gettz
 from skill_sdk.i18n import _, _n, _a, Translations
 
 logger = logging.getLogger(__name__)
 
 SAMPLE_LOCALE = "de"
 
+OUTSIDE_OF_REQUEST = (
+    "Accessing request local object outside of the request-response cycle."
+)
+
 
 class Context(CamelModel):
     """Intent invocation context"""
@@ -59,30 +64,23 @@ class Context(CamelModel):
     # User profile configuration
     user_profile_config: Optional[Text]
 
-    @staticmethod
-    def _(*args, **kwargs):
-        return _(*args, **kwargs)
-
-    @staticmethod
-    def _n(*args, **kwargs):
-        return _n(*args, **kwargs)
-
-    @staticmethod
-    def _a(*args, **kwargs):
-        return _a(*args, **kwargs)
+    # Translation shortcuts: bound directly to lazy translation functions
+    _ = staticmethod(_)
+    _n = staticmethod(_n)
+    _a = staticmethod(_a)
 
     def _get_attr_value(self, attr, default=None):
         """Silently return first item from attributes array"""
-        try:
-            attr_v2 = self.attributes_v2[attr][0]
-            return attr_v2.value
-        except LookupError:
-            logger.error(
-                "Attribute %s is not in context. Defaulting to %s",
-                repr(attr),
-                repr(default),
-            )
-            return default
+        values = self.attributes_v2.get(attr)
+        if values:
+            return values[0].value
+
+        logger.error(
+            "Attribute %s is not in context. Defaulting to %s",
+            repr(attr),
+            repr(default),
+        )
+        return default
 
     def gettz(self) -> datetime.tzinfo:
         """
@@ -91,7 +89,7 @@ class Context(CamelModel):
         :return:
         """
         _tz = self._get_attr_value("timezone")
-        timezone = tz.gettz(_tz)
+        timezone = cached_gettz(_tz)
 
         if timezone is None:
             logger.error(
@@ -202,12 +200,17 @@ class RequestContextVar(ContextDecorator):
         return 0 if self.__request_token is None else 1
 
     def __getattr__(self, item):
+        storage = self._request_scope_storage.get(None)
+        obj = storage.get(self._scope) if storage else None
+
+        if obj is None:
+            logger.error(OUTSIDE_OF_REQUEST)
+            return None
+
         try:
-            return getattr(self._request_scope_storage.get()[self._scope], item)
-        except (AttributeError, LookupError) as e:
-            logger.error(
-                "Accessing request local object outside of the request-response cycle."
-            )
+            return getattr(obj, item)
+        except AttributeError as e:
+            logger.error(OUTSIDE_OF_REQUEST)
             logger.debug("Details: %s", repr(e))
 
     def __enter__(self):
@@ -10,13 +10,26 @@
 """Logging"""
 
 import os
-import time
 import json
-import logging.config
+import time
+import logging
 from traceback import format_exc
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
+
+import orjson
 
 from skill_sdk import config
+from skill_sdk.middleware import HeaderKeys, context
+
+# Human-readable log format
+HUMAN_FORMAT = "%(asctime)s %(levelname)-8s %(name)s - %(message)s"
+
+# Tracing headers outside of a request (read-only, shared)
+NO_TRACING_HEADERS: Mapping = MappingProxyType({})
+
+# Tracing headers copied from request context
+TRACING_HEADER_KEYS = tuple(HeaderKeys)
 
 
 def setup_logging(
@@ -34,46 +47,56 @@ def setup_logging(
     log_level = log_level or config.settings.LOG_LEVEL
     log_format = log_format or config.settings.LOG_FORMAT
 
-    logging.getLogger().setLevel(log_level)
-    logging.basicConfig(level=log_level)
-
-    try:
-        logging.config.dictConfig(get_config_dict(log_level, log_format))
-    except KeyError:
+    if log_format == config.FormatType.GELF:
+        formatter: logging.Formatter = CloudGELFFormatter()
+    elif log_format == config.FormatType.HUMAN:
+        formatter = logging.Formatter(HUMAN_FORMAT)
+    else:
         raise RuntimeError("Invalid log format: %s", repr(log_format))
 
+    handler = logging.StreamHandler()
+    handler.setLevel(log_level)
+    handler.setFormatter(formatter)
+
+    # Replace root handlers, the same way `logging.config.dictConfig(get_config_dict(...))` does
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+        existing.close()
+    root.addHandler(handler)
+    root.setLevel(log_level)
 
-def tracing_headers() -> Dict:
+
+def tracing_headers() -> Mapping:
     """Extract tracing headers from Starlette's context"""
-    from skill_sdk.middleware import HeaderKeys, context
 
-    try:
-        return {
-            key: context.data[key]
-            for key in HeaderKeys
-            if context.data[key] is not None
-        }
     # If we're not inside a request
-    except RuntimeError:
-        return {}
+    if not context.exists():
+        return NO_TRACING_HEADERS
+
+    data = context.data
+    headers = {}
+    for key in TRACING_HEADER_KEYS:
+        value = data.get(key)
+        if value is not None:
+            headers[key] = value
+    return headers
 
 
 class CloudGELFFormatter(logging.Formatter):
     """Graylog Extended Format (GELF) formatter"""
 
     def format(self, record: logging.LogRecord):
-        from skill_sdk.middleware import HeaderKeys
-
         headers = tracing_headers()
 
         # Cloud log record format
         line = {
             # Timestamp in milliseconds
-            "@timestamp": int(round(time.time() * 1000)),
+            "@timestamp": time.time_ns() // 1_000_000,
             # Log message level
             "level": record.levelname,
-            # Process id
-            "process": os.getpid(),
+            # Process id (captured by LogRecord, unless `logging.logProcesses` is off)
+            "process": record.process or os.getpid(),
             # Thread id
             "thread": str(record.thread),
             # Logger name
@@ -94,7 +117,11 @@ class CloudGELFFormatter(logging.Formatter):
         if record.exc_info:
             line["_traceback"] = format_exc()
 
-        return json.dumps(line)
+        try:
+            return orjson.dumps(line).decode()
+        except orjson.JSONEncodeError:
+            # orjson rejects strings that are not valid UTF-8 (eg. lone surrogates)
+            return json.dumps(line)
 
 
 def get_config_dict(log_level: int, log_format: config.FormatType) -> Dict:
@@ -123,7 +150,7 @@ def get_config_dict(log_level: int, log_format: config.FormatType) -> Dict:
             "disable_existing_loggers": False,
             "formatters": {
                 "standard": {
-                    "format": "%(asctime)s %(levelname)-8s %(name)s - %(message)s",
+                    "format": HUMAN_FORMAT,
                 }
             },
             "handlers": {
@@ -149,22 +176,23 @@ def patch_logger():
     :return:
     """
 
-    from skill_sdk.middleware import HeaderKeys, context
-
     _super = logging.Logger.isEnabledFor
+    _user_debug_log = HeaderKeys.user_debug_log
 
     def is_enabled_for(instance: logging.Logger, level):
         """
         Return True if "X-User-Debug-Log" flag is set
 
+            (checks if the request context exists to avoid raising an exception
+             on every log call outside of a request)
+
         :param instance:    logging.Logger instance
         :param level:       logging level
         :return:
         """
-        try:
-            return context.data[HeaderKeys.user_debug_log] or _super(instance, level)
-        except (KeyError, RuntimeError):
-            return _super(instance, level)
+        if context.exists() and context.data.get(_user_debug_log):
+            return True
+        return _super(instance, level)
 
     logging.Logger.isEnabledFor = is_enabled_for
 
@@ -177,31 +205,42 @@ patch_logger()
 #  Limit log message size                                                     #
 #                                                                             #
 ###############################################################################
-def _trim(s):
-    """Trim long string to LOG_ENTRY_MAX_STRING(+3) length"""
+def _trim(s, max_length: int):
+    """Trim long string to max_length(+3) length"""
     return (
-        s
-        if not isinstance(s, str) or len(s) < config.settings.LOG_ENTRY_MAX_STRING
-        else s[: config.settings.LOG_ENTRY_MAX_STRING] + "..."
+        s if not isinstance(s, str) or len(s) < max_length else s[:max_length] + "..."
     )
 
 
-def _copy(d):
+def _needs_trim(d, max_length: int) -> bool:
+    """Recursively check if any string value is longer than max_length"""
+
+    if isinstance(d, dict):
+        return any(_needs_trim(v, max_length) for v in d.values())
+    elif isinstance(d, (list, tuple)):
+        return any(_needs_trim(v, max_length) for v in d)
+    else:
+        return isinstance(d, str) and len(d) >= max_length
+
+
+def _copy(d, max_length: int):
     """Recursively copy dictionary values, trimming long strings"""
 
     if isinstance(d, dict):
-        return {k: _copy(v) for k, v in d.items()}
+        return {k: _copy(v, max_length) for k, v in d.items()}
     elif isinstance(d, (list, tuple)):
-        return [_copy(v) for v in d]
+        return [_copy(v, max_length) for v in d]
     else:
-        return _trim(d)
+        return _trim(d, max_length)
 
 
 def prepare_for_logging(record):
     """
-    Trim long strings before logging a record
+    Trim long strings before logging a record:
+        the record is returned unchanged if there is nothing to trim
 
     :param record:  value to log
     :return:
     """
-    return _copy(record)
+    max_length = config.settings.LOG_ENTRY_MAX_STRING
+    return _copy(record, max_length) if _needs_trim(record, max_length) else record
@@ -24,19 +24,39 @@ class HeaderKeys(str, Enum):
     user_debug_log = "X-User-Debug-Log"
 
 
-class TraceIdPlugin(Plugin):
+class HeaderPlugin(Plugin):
+    """
+    Extracts header value from request:
+    the header name is lower-cased and encoded once, when a plugin class is defined
+    """
+
+    raw_key: bytes
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.raw_key = cls.key.lower().encode("latin-1")
+
+    async def extract_value_from_header_by_key(self, request):
+        raw_key = self.raw_key
+        for key, value in request.headers.raw:
+            if key == raw_key:
+                return value.decode("latin-1")
+        return None
+
+
+class TraceIdPlugin(HeaderPlugin):
     """Extracts trace ID from request"""
 
     key = HeaderKeys.trace_id
 
 
-class SpanIdIdPlugin(Plugin):
+class SpanIdIdPlugin(HeaderPlugin):
     """Extracts span ID from request"""
 
     key = HeaderKeys.span_id
 
 
-class TenantIdIdPlugin(Plugin):
+class TenantIdIdPlugin(HeaderPlugin):
     """**IMPORTANT**: for logging purpose only, do not base tenant-specific logic on this header
 
     Extracts tenant ID from request
@@ -45,7 +65,7 @@ class TenantIdIdPlugin(Plugin):
     key = HeaderKeys.tenant_id
 
 
-class TestingFlagPlugin(Plugin):
+class TestingFlagPlugin(HeaderPlugin):
     """
     Extracts "testing" flag from request:
     testing flag distinguishes testing traffic from production
@@ -54,7 +74,7 @@ class TestingFlagPlugin(Plugin):
     key = HeaderKeys.testing_flag
 
 
-class UserDebugLogPlugin(Plugin):
+class UserDebugLogPlugin(HeaderPlugin):
     """
     Extracts "user debug log" flag from request:
     the flag is set to temporary activate debug logging for the user
@@ -11,8 +11,8 @@
 """Tracing middleware"""
 
 import logging
+from functools import wraps
 from fastapi import FastAPI
-from contextlib import ContextDecorator
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +27,7 @@ except ModuleNotFoundError:
     raise
 
 
-class start_span(ContextDecorator):
+class start_span:
     """
     Tracing helper/span wrapper.
 
@@ -44,6 +44,9 @@ class start_span(ContextDecorator):
 
     """
 
+    # No per-instance __dict__ (hence not derived from `contextlib.ContextDecorator`)
+    __slots__ = ("operation_name", "args", "kwargs", "_span")
+
     def __init__(self, operation_name, *args, **kwargs):
         self.operation_name = operation_name
         self.args = args
@@ -57,6 +60,14 @@ class start_span(ContextDecorator):
     def __exit__(self, _exc_type, _exc_value, _exc_traceback):
         return self._span.__exit__(_exc_type, _exc_value, _exc_traceback)
 
+    def __call__(self, func):
+        @wraps(func)
+        def inner(*args, **kwargs):
+            with self:
+                return func(*args, **kwargs)
+
+        return inner
+
 
 def setup(app: FastAPI, tracer: Tracer) -> None:
     """
@@ -9,7 +9,7 @@
 
 """HTTP sync/async clients with circuit breaker"""
 
-from typing import Callable, Iterable, List, Union
+from typing import Callable, Container, Iterable, List, Union
 import logging
 from warnings import warn
 
@@ -66,6 +66,17 @@ class Client(httpx.Client):
         if response_hook:
             self.event_hooks = dict(response=[response_hook])
 
+    def _checked_request(self, *args, exclude: Container[int], **kwargs):
+        """Wraps Client.request: raises HTTPError, unless status code is excluded"""
+        _r = super().request(*args, **kwargs)
+
+        if _r.status_code in exclude:
+            logger.debug("Status code %s is excluded", _r.status_code)
+        else:
+            _r.raise_for_status()
+
+        return _r
+
     def request(
         self,
         *args,
@@ -75,27 +86,20 @@ class Client(httpx.Client):
         exclude = exclude or self.exclude
 
         # Propagate tracing headers if request is created as "internal"
-        if self.internal:
+        #   (the request headers are copied only if there is something to add)
+        headers = tracing_headers() if self.internal else None
+        if headers:
             logger.debug("Internal service, adding tracing headers.")
-            kwargs["headers"] = {
-                **(kwargs.get("headers", None) or {}),
-                **tracing_headers(),
-            }
-
-        @self.circuit_breaker
-        def _inner_call(*a, **kw):
-            """Wraps Client.request"""
-            _r = super(Client, self).request(*a, **kw)
-
-            if _r.status_code in exclude:
-                logger.debug("Status code %s is excluded", _r.status_code)
-            else:
-                _r.raise_for_status()
-
-            return _r
+            # Any headers type accepted by httpx (mapping or list of pairs), names are case-insensitive
+            request_headers = httpx.Headers(kwargs.get("headers", None) or {})
+            for key, value in headers.items():
+                request_headers[key] = value
+            kwargs["headers"] = request_headers
 
         try:
-            result = _inner_call(*args, **kwargs)
+            result = self.circuit_breaker.call(
+                self._checked_request, *args, exclude=exclude, **kwargs
+            )
             logger.debug("HTTP completed with status code: %d", result.status_code)
 
         except HTTPError as e:
@@ -146,6 +150,17 @@ class AsyncClient(httpx.AsyncClient):
         if response_hook:
             self.event_hooks = dict(response=[response_hook])
 
+    async def _checked_request(self, *args, exclude: Container[int], **kwargs):
+        """Wraps AsyncClient.request: raises HTTPError, unless status code is excluded"""
+        _r = await super().request(*args, **kwargs)
+
+        if _r.status_code in exclude:
+            logger.debug("Status code %s is excluded", _r.status_code)
+        else:
+            _r.raise_for_status()
+
+        return _r
+
     async def request(
         self,
         *args,
@@ -155,27 +170,20 @@ class AsyncClient(httpx.AsyncClient):
         exclude = exclude or self.exclude
 
         # Propagate tracing headers if request is created as "internal"
-        if self.internal:
+        #   (the request headers are copied only if there is something to add)
+        headers = tracing_headers() if self.internal else None
+        if headers:
             logger.debug("Internal service, adding tracing headers.")
-            kwargs["headers"] = {
-                **(kwargs.get("headers", None) or {}),
-                **tracing_headers(),
-            }
-
-        @self.circuit_breaker
-        async def _inner_call(*a, **kw):
-            """Wraps Client.request"""
-            _r = await super(AsyncClient, self).request(*a, **kw)
-
-            if _r.status_code in exclude:
-                logger.debug("Status code %s is excluded", _r.status_code)
-            else:
-                _r.raise_for_status()
-
-            return _r
+            # Any headers type accepted by httpx (mapping or list of pairs), names are case-insensitive
+            request_headers = httpx.Headers(kwargs.get("headers", None) or {})
+            for key, value in headers.items():
+                request_headers[key] = value
+            kwargs["headers"] = request_headers
 
         try:
-            result = await _inner_call(*args, **kwargs)
+            result = await self.circuit_breaker.call_async(
+                self._checked_request, *args, exclude=exclude, **kwargs
+            )
             logger.debug("HTTP completed with status code: %d", result.status_code)
 
         except HTTPError as e:
@@ -57,7 +57,8 @@ def tell(text: Text, **kwargs) -> Response:
     :param kwargs:
     :return:
     """
-    return Response(**{**kwargs, **dict(text=text, type=ResponseType.TELL)})
+    kwargs.update(text=text, type=ResponseType.TELL)
+    return Response(**kwargs)
 
 
 def ask(text: Text, **kwargs) -> Response:
@@ -68,7 +69,8 @@ def ask(text: Text, **kwargs) -> Response:
     :param kwargs:
     :return:
     """
-    return Response(**{**kwargs, **dict(text=text, type=ResponseType.ASK)})
+    kwargs.update(text=text, type=ResponseType.ASK)
+    return Response(**kwargs)
 
 
 def ask_freetext(text: Text, **kwargs) -> Response:
@@ -79,4 +81,5 @@ def ask_freetext(text: Text, **kwargs) -> Response:
     :param kwargs:
     :return:
     """
-    return Response(**{**kwargs, **dict(text=text, type=ResponseType.ASK_FREETEXT)})
+    kwargs.update(text=text, type=ResponseType.ASK_FREETEXT)
+    return Response(**kwargs)
@@ -15,6 +15,7 @@ from enum import Enum
 from typing import Any, Dict, Optional, List, Text, Union
 
 from skill_sdk.i18n import Message
+from skill_sdk.intents.request import r
 from skill_sdk.util import CamelModel
 from skill_sdk.responses.card import Card, ListSection
 from skill_sdk.responses.command import Command
@@ -92,14 +93,15 @@ class SkillInvokeResponse(CamelModel):
                 f"Ambiguous response type: 'type_'={type_} and 'type='{data['type']}."
             )
 
-        params: Dict[str, Any] = dict(text=text)
+        # `data` is a fresh dictionary of keyword arguments: update it in place
+        data.update(text=text)
         if type_ is not None:
-            params.update(type=type_)
+            data.update(type=type_)
 
         if result and isinstance(result, Dict):
-            params.update(result=Result(result))
+            data.update(result=Result(result))
 
-        super().__init__(**{**data, **params})
+        super().__init__(**data)
 
     def with_card(
         self,
@@ -212,8 +214,6 @@ def _enrich(response: SkillInvokeResponse) -> SkillInvokeResponse:
     :param response:
     :return:
     """
-    from skill_sdk.intents.request import r
-
     if isinstance(response, str):
         # Convert string response to Response object
         response = SkillInvokeResponse(text=response)
@@ -12,10 +12,12 @@
 
 import logging
 import secrets
-from typing import Text
+from typing import Any, Callable, Text
 
+import orjson
 from fastapi import Depends, FastAPI, Request, Security
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from fastapi.routing import APIRoute
 from fastapi.exceptions import HTTPException
 from fastapi.security.http import (
     HTTPBasic,
@@ -34,6 +36,27 @@ logger = logging.getLogger(__name__)
 security = HTTPBasic()
 
 
+class ORJSONRequest(Request):
+    """Request that parses JSON body with orjson"""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """API route that hands over ORJSONRequest to the endpoint"""
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request) -> Response:
+            return await handler(ORJSONRequest(request.scope, request.receive))
+
+        return orjson_route_handler
+
+
 def check_credentials(username: Text, password: Text):
     """
     Check request credentials:
@@ -85,6 +108,20 @@ async def handle_info_request(request: Request):
     )
 
 
+# Empty translation shared by requests with unsupported locale
+NULL_TRANSLATION = skill_sdk.i18n.Translations()
+
+
+def _get_translation(app: skill_sdk.Skill, locale: Text) -> skill_sdk.i18n.Translations:
+    """Get translation for locale, or empty translation if does not exist"""
+
+    translation = app.translations.get(locale)
+    if translation is None:
+        logger.error("Translation for locale %s is not available.", repr(locale))
+        return NULL_TRANSLATION
+    return translation
+
+
 async def invoke_intent(
     rq: Request,
     request: skill_sdk.intents.Request,
@@ -100,22 +137,11 @@ async def invoke_intent(
     :return:
     """
 
-    def _get_translation(
-        app: skill_sdk.Skill, locale: Text
-    ) -> skill_sdk.i18n.Translations:
-        """Get translation for locale, or empty translation if does not exist"""
-
-        if locale not in app.translations:
-            logger.error("Translation for locale %s is not available.", repr(locale))
-            return skill_sdk.i18n.Translations()
-        return app.translations[locale]
-
-    if request.context.intent not in rq.app.intents:
+    handler = rq.app.intents.get(request.context.intent)
+    if handler is None:
         logger.error("Intent not found: %s", repr(request.context.intent))
         return JSONResponse({"code": 1, "text": "Intent not found!"}, status_code=404)
 
-    handler = rq.app.intents[request.context.intent]
-
     return await invoke(
         handler,
         request.with_translation(_get_translation(rq.app, request.context.locale)),
@@ -175,7 +201,8 @@ def setup_routes(app: FastAPI):
         else []
     )
 
-    app.add_api_route(
+    # Invoke requests are parsed with orjson
+    app.router.add_api_route(
         f"{api_base()}",
         invoke_intent,
         dependencies=authentication,
@@ -184,6 +211,7 @@ def setup_routes(app: FastAPI):
         response_model_exclude_none=True,
         name="Invoke Intent",
         tags=["Skill endpoints"],
+        route_class_override=ORJSONRoute,
     )
 
     app.add_api_route(
@@ -12,8 +12,7 @@
 
 import json
 import logging
-from collections import defaultdict
-from typing import DefaultDict, Dict, List, Optional, Text
+from typing import Dict, List, Optional, Text
 from datetime import datetime
 
 from skill_sdk import i18n
@@ -84,7 +83,7 @@ class TextService(BaseService):
 
         :return:
         """
-        catalog: DefaultDict = defaultdict(dict)
+        catalog: TranslationCatalog = {}
 
         try:
 
@@ -96,7 +95,8 @@ class TextService(BaseService):
             data = self.client.get(f"{self.url}/scope/{self.scope}").json()
             entries = [Translation(**_) for _ in data]
 
-            [catalog[_.locale].update({_.tag: _.sentences}) for _ in entries]
+            for _ in entries:
+                catalog.setdefault(_.locale, {})[_.tag] = _.sentences
 
         except (
             KeyError,
@@ -110,4 +110,4 @@ class TextService(BaseService):
                 repr(ex),
             )
 
-        return dict(catalog)
+        return catalog
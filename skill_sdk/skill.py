@@ -9,11 +9,10 @@
 
 """Skill runner"""
 
-import inspect
 import logging
-from functools import partial
-from types import MappingProxyType
-from typing import Any, Callable, Dict, Mapping, Text, Union
+from functools import lru_cache, partial
+from types import FunctionType, MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Text, Tuple, Union
 from fastapi import FastAPI
 
 from skill_sdk import i18n, util
@@ -40,26 +39,54 @@ class Skill(FastAPI):
 
     locales: Mapping[Text, i18n.Translations]
 
-    intents: Mapping[Text, Callable]
-
     #
     # Temporary dictionary with intent implementations
     #
     __intents: Dict[Text, Callable] = {}
 
+    #
+    # Reverse mapping of registered implementations to intent names
+    #
+    __handlers: Dict[Callable, Text] = {}
+
+    #
+    # Decorated implementations by (handler, error handler) ids:
+    #   a handler registered for several intents shares the wrapper
+    #
+    __decorated: Dict[Tuple[int, int], Callable] = {}
+
+    #
+    # Read-only view of intent implementations (shared by all instances)
+    #
+    intents: Mapping[Text, Callable] = MappingProxyType(__intents)
+
     def __init__(
         self,
         *,
         translations: Dict[Text, i18n.Translations] = None,
+        _test_only: bool = False,
         **kwargs,
     ) -> None:
 
         self.translations = translations or i18n.load_translations()
-        self.intents = MappingProxyType(self.__intents)
+
+        if _test_only:
+            # `test_intent` helper needs intent handlers only: skip routes/OpenAPI setup
+            return
 
         super().__init__(**kwargs)
 
-        util.populate_intent_examples(self.intents)
+    def openapi(self) -> Dict[Text, Any]:
+        """
+        Populate intent invoke examples right before OpenAPI schema is generated:
+            intent handlers are usually included after the app is created
+
+        :return:
+        """
+        if not self.openapi_schema:
+            util.populate_intent_examples(self.intents)
+
+        return super().openapi()
 
     def get_intent(self, name: Text):
         """
@@ -69,7 +96,8 @@ class Skill(FastAPI):
         :param name:
         :return:
         """
-        return self.intents.get(name, self.intents.get(FALLBACK_INTENT))
+        handler = self.intents.get(name)
+        return handler if handler is not None else self.intents.get(FALLBACK_INTENT)
 
     def include(
         self,
@@ -96,20 +124,13 @@ class Skill(FastAPI):
                 f"Cannot redefine existing intent {repr(intent)} handler: {repr(self.intents[intent])}"
             )
 
-        registered = ""
-        try:
-            registered = [
-                intent
-                for intent, implementation in self.intents.items()
-                if handler is implementation
-            ][0]
+        registered = self.__handlers.get(handler, "")
+        if registered:
             logger.debug(
                 "Intent %s handler %s already registered",
                 repr(registered),
                 repr(handler),
             )
-        except IndexError:
-            pass
 
         if intent and not registered:
             self.__intents[intent] = self.__register(intent, handler, error_handler)
@@ -132,13 +153,20 @@ class Skill(FastAPI):
                 f"Duplicate intent {repr(intent)} with handler {repr(handler)}"
             )
 
-        if not inspect.isfunction(handler):
+        if not isinstance(handler, FunctionType):
             raise ValueError(
                 f"Wrong handler type: {type(handler)}. Expecting coroutine or function."
             )
 
-        decorated = handlers.intent_handler(handler, error_handler=error_handler)
+        key = (id(handler), id(error_handler))
+        decorated = Skill.__decorated.get(key)
+        if decorated is None:
+            decorated = Skill.__decorated[key] = handlers.intent_handler(
+                handler, error_handler=error_handler
+            )
+
         Skill.__intents[intent] = decorated
+        Skill.__handlers.setdefault(decorated, intent)
         logger.debug("Intent %s static handler: %s", repr(intent), repr(decorated))
         return decorated
 
@@ -212,6 +240,26 @@ class Skill(FastAPI):
         """
 
         self.__intents.clear()
+        self.__handlers.clear()
+        self.__decorated.clear()
+
+
+@lru_cache(maxsize=None)
+def _prometheus_setup() -> Optional[Callable[[FastAPI], None]]:
+    """
+    Since Prometheus metrics exporter is optional,
+    try to load prometheus middleware and simply eat an exception
+
+        (the failed import is not retried every time an app is created)
+
+    :return:
+    """
+    try:
+        from middleware.prometheus import setup
+
+        return setup
+    except ModuleNotFoundError:
+        return None
 
 
 def init_app(config_path: Text = None, develop: bool = None) -> Skill:
@@ -243,14 +291,9 @@ def init_app(config_path: Text = None, develop: bool = None) -> Skill:
     middleware.setup_middleware(app)
     routes.setup_routes(app)
 
-    # Since Prometheus metrics exporter is optional,
-    # try to load prometheus middleware and simply eat an exception
-    try:
-        from middleware.prometheus import setup
-
-        setup(app)
-    except ModuleNotFoundError:
-        pass
+    prometheus_setup = _prometheus_setup()
+    if prometheus_setup is not None:
+        prometheus_setup(app)
 
     if develop:
         from skill_sdk import ui
@@ -263,6 +306,12 @@ def init_app(config_path: Text = None, develop: bool = None) -> Skill:
 intent_handler = Skill.intent_handler
 
 
+@lru_cache(maxsize=None)
+def _test_app() -> Skill:
+    """Skill instance reused by `test_intent` helper (intent handlers are shared anyway)"""
+    return Skill(_test_only=True)
+
+
 def test_intent(
     intent: Text,
     translation: i18n.Translations = None,
@@ -279,7 +328,7 @@ def test_intent(
     :return:
     """
 
-    app = Skill()
+    app = _test_app()
 
     return util.run_until_complete(
         app.test_intent(intent, translation, session=session, **kwargs)
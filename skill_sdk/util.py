@@ -21,7 +21,18 @@ import unittest.mock
 from functools import partial
 from contextvars import copy_context
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Awaitable, Callable, Dict, List, Mapping, Text, TypeVar, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Text,
+    TypeVar,
+    Union,
+)
 
 import orjson
 import pydantic
@@ -33,6 +44,11 @@ import uvicorn
 
 T = TypeVar("T")
 
+# Case conversion patterns (`snake_to_camel` is called for every model field alias)
+RE_CAMEL_WORD = re.compile("(.)([A-Z][a-z]+)")
+RE_CAMEL_CASE = re.compile("([a-z0-9])([A-Z])")
+RE_SNAKE_CASE = re.compile(r"_+[a-z0-9]")
+
 
 def camel_to_snake(name):
     """
@@ -41,8 +57,8 @@ def camel_to_snake(name):
     :param name:
     :return:
     """
-    name = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", name).lower()
+    name = RE_CAMEL_WORD.sub(r"\1_\2", name)
+    return RE_CAMEL_CASE.sub(r"\1_\2", name).lower()
 
 
 def snake_to_camel(name):
@@ -52,8 +68,7 @@ def snake_to_camel(name):
     :param name:
     :return:
     """
-    reg_ex = re.compile(r"_+[a-z0-9]")
-    return reg_ex.sub(lambda x: x.group(0)[1].upper(), name)
+    return RE_SNAKE_CASE.sub(lambda x: x.group(0)[1].upper(), name)
 
 
 def orjson_dumps(v, *, default):
@@ -108,6 +123,10 @@ class ContextVarExecutor(ThreadPoolExecutor):
         return super().submit(ctx.run, *args, **kwargs)
 
 
+# Thread pool shared by synchronous handlers: created on first use
+_executor: Optional[ContextVarExecutor] = None
+
+
 async def run_in_executor(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
     """
     Run a synchronous function in a thread pool to prevent blocking
@@ -117,11 +136,16 @@ async def run_in_executor(func: Callable[..., T], *args: Any, **kwargs: Any) ->
     :param kwargs:
     :return:
     """
+    global _executor
+
+    if _executor is None:
+        from skill_sdk.config import settings
+
+        _executor = ContextVarExecutor(max_workers=settings.EXECUTOR_MAX_WORKERS)
+
     loop = asyncio.get_running_loop()
 
-    return await loop.run_in_executor(
-        ContextVarExecutor(), partial(func, *args, **kwargs)
-    )
+    return await loop.run_in_executor(_executor, partial(func, *args, **kwargs))
 
 
 def run_until_complete(func: Awaitable[T]) -> T:
@@ -181,14 +205,10 @@ class BaseModel(pydantic.BaseModel):
             - export fields by alias
 
         """
-        params = {
-            "exclude_none": kwargs["exclude_none"]
-            if "exclude_none" in kwargs
-            else True,
-            "by_alias": kwargs["by_alias"] if "by_alias" in kwargs else True,
-        }
+        kwargs.setdefault("exclude_none", True)
+        kwargs.setdefault("by_alias", True)
 
-        return super().dict(*args, **{**kwargs, **params})
+        return super().dict(*args, **kwargs)
 
 
 class CamelModel(BaseModel):
@@ -10,7 +10,6 @@
 import os
 import sys
 import pathlib
-import pkg_resources
 from argparse import Namespace
 
 import pytest
@@ -22,6 +21,9 @@ from skill_sdk.util import run_until_complete
 
 APP = "app:app"
 
+# Scaffold project shipped with the CLI (resolved without importing `pkg_resources`)
+SCAFFOLD_PATH = pathlib.Path(init.__file__).parent / "scaffold"
+
 
 @pytest.fixture
 def debug_logging(monkeypatch):
@@ -46,10 +48,32 @@ def test_import_module_app():
     assert cli is test_cli
 
 
+def test_import_module_app_dir(tmp_path, monkeypatch):
+
+    package = tmp_path / "skill_impl"
+    package.mkdir()
+    (package / "one.py").write_text("ONE = 1")
+    (package / "two.py").write_text("TWO = 2")
+    (package / "readme.txt").write_text("not a module")
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    try:
+        module, app = import_module_app("skill_impl")
+
+        assert module.__name__ == "skill_impl" and app is None
+        assert sys.modules["skill_impl.one"].ONE == 1
+        assert sys.modules["skill_impl.two"].TWO == 2
+    finally:
+        # Do not leave the temporary package in sys.modules for the other tests
+        for name in ("skill_impl", "skill_impl.one", "skill_impl.two"):
+            sys.modules.pop(name, None)
+
+
 def test_run(debug_logging, mocker, monkeypatch):
 
-    scaffold_path = pkg_resources.resource_filename(run.__name__, "scaffold")
-    cwd = pathlib.Path(scaffold_path).absolute().__str__()
+    cwd = SCAFFOLD_PATH.absolute().__str__()
     if cwd not in sys.path:
         monkeypatch.syspath_prepend(cwd)
 
@@ -63,8 +87,7 @@ def test_run(debug_logging, mocker, monkeypatch):
 
 def test_develop(debug_logging, mocker, monkeypatch):
 
-    scaffold_path = pkg_resources.resource_filename(develop.__name__, "scaffold")
-    cwd = pathlib.Path(scaffold_path).absolute().__str__()
+    cwd = SCAFFOLD_PATH.absolute().__str__()
     if cwd not in sys.path:
         monkeypatch.syspath_prepend(cwd)
 
@@ -109,8 +132,7 @@ def test_init(tmpdir):
 def test_version(capsys: CaptureFixture, mocker):
     from skill_sdk import config
 
-    scaffold_path = pkg_resources.resource_filename(develop.__name__, "scaffold")
-    skill_conf = str(pathlib.Path(scaffold_path) / "skill.conf")
+    skill_conf = str(SCAFFOLD_PATH / "skill.conf")
     mocker.patch.object(config, "get_skill_config_file", return_value=skill_conf)
 
     version.execute()
@@ -123,11 +145,14 @@ def test_version(capsys: CaptureFixture, mocker):
 def change_dir(request):
     """Fixture: set current dir to the path of `scaffold` project, and revert after the test"""
 
-    scaffold_path = pkg_resources.resource_filename(init.__name__, "scaffold")
-    os.chdir(scaffold_path)
+    os.chdir(SCAFFOLD_PATH)
     yield
     os.chdir(request.config.invocation_dir)
 
+    # Remove translations compiled by the scaffold tests: `vs init` copies the scaffold as is
+    for mo in (SCAFFOLD_PATH / "locale").glob("*.mo"):
+        mo.unlink()
+
 
 def test_scaffold(change_dir):
     """Run scaffold project testing suite"""
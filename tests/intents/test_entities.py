@@ -133,6 +133,8 @@ class TestEntityTimeRange(unittest.TestCase):
                 ),
             ],
         )
+        with self.assertRaises(TypeError):
+            next(TimeRange("2019-02-08T12:27:20/2019-02-08T15:48:20").range("ages"))
 
     def test_range_open(self):
         """Test datetime range with open begin/end"""
@@ -207,6 +209,7 @@ class TestEntityTimeSet(unittest.TestCase):
         self.assertEqual('<TimeSet timex="T08" tz="tzutc()">', str(TimeSet("T08")))
         timex = TimeSet("T08", tz="Europe/Berlin")
         self.assertIsInstance(timex.tz, datetime.tzinfo)
+        self.assertIs(timex.tz, TimeSet("T09", tz="Europe/Berlin").tz)
 
         with self.assertRaises(ValueError):
             TimeSet("Hello").range()
@@ -391,6 +394,12 @@ class TestConverter(unittest.TestCase):
         with self.assertRaises(ValueError):
             convert(1, bool)
 
+    def test_converter_subclass(self):
+        class Date(datetime.date):
+            pass
+
+        self.assertEqual(convert("2106-12-31T12:30", Date), datetime.date(2106, 12, 31))
+
     def test_datetime(self):
         self.assertEqual(
             entities.to_datetime("2106-12-31T12:30"),
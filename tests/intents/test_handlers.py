@@ -26,6 +26,8 @@ from skill_sdk.intents import (
 from skill_sdk import util
 from skill_sdk.util import create_request, mock_datetime_now
 
+INVALID_DATE_REQUEST = create_request("TEST_CONTEXT", date=["not a date"])
+
 
 class TestHandlerDecorator(unittest.TestCase):
     def test_handler_no_type_hints(self):
@@ -123,9 +125,8 @@ class TestHandlerDecorator(unittest.TestCase):
         def decorated_test(date: datetime.date):
             return date
 
-        r = create_request("TEST_CONTEXT", date=["not a date"])
         with self.assertRaises(EntityValueException):
-            result = decorated_test(r)
+            result = decorated_test(INVALID_DATE_REQUEST)
 
     def test_handler_fail_silent(self):
         """Test date conversion of invalid date in "silent" mode"""
@@ -134,8 +135,7 @@ class TestHandlerDecorator(unittest.TestCase):
         def date_test(date: datetime.date):
             return date
 
-        r = create_request("TEST_CONTEXT", date=["not a date"])
-        result = date_test(r)
+        result = date_test(INVALID_DATE_REQUEST)
         self.assertIsInstance(result, EntityValueException)
 
         @intent_handler
@@ -177,7 +177,7 @@ class TestHandlerDecorator(unittest.TestCase):
         def date_test(date: datetime.date):
             return None
 
-        result = date_test(create_request("TEST_CONTEXT", date=["not a date"]))
+        result = date_test(INVALID_DATE_REQUEST)
         self.assertEqual(
             result,
             (
@@ -44,8 +44,9 @@ def test_session():
 
 
 class TestContext(unittest.TestCase):
-    def setUp(self):
-        self.ctx = create_context(TEST_INTENT)
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = create_context(TEST_INTENT)
 
     def test_tz_functions(self):
         now = datetime.datetime(
@@ -54,9 +55,9 @@ class TestContext(unittest.TestCase):
 
         self.assertEqual("CET", self.ctx.gettz().tzname(now))
         ctx = create_context(TEST_INTENT, timezone="Mars")
-        with patch.object(logging.Logger, "error") as log:
+        with self.assertLogs("skill_sdk.intents.request", logging.ERROR) as log:
             self.assertEqual("UTC", ctx.gettz().tzname(now))
-            self.assertEqual(log.call_count, 1)
+            self.assertEqual(len(log.records), 1)
 
         with mock_datetime_now(now, datetime):
             # Make sure timezone is set to "Europe/Berlin"
@@ -77,8 +78,17 @@ class TestContext(unittest.TestCase):
                 self.assertEqual(local_today.hour, 0)
                 self.assertEqual(local_today.minute, 0)
 
+    def test_gettz_cached(self):
+        from skill_sdk.intents.entities import _gettz
+
+        _gettz.cache_clear()
+        self.assertIs(self.ctx.gettz(), self.ctx.gettz())
+        self.assertEqual(_gettz.cache_info().hits, 1)
+
     def test_missing_attribute(self):
         self.assertEqual("Value", self.ctx._get_attr_value("Non-existing", "Value"))
+        ctx = create_context(TEST_INTENT, empty=[])
+        self.assertEqual("Value", ctx._get_attr_value("empty", "Value"))
 
 
 def run_thread(func):
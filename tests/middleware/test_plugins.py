@@ -0,0 +1,36 @@
+#
+# voice-skill-sdk
+#
+# (C) 2021, Deutsche Telekom AG
+#
+# This file is distributed under the terms of the MIT license.
+# For details see the file LICENSE in the top directory.
+#
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from skill_sdk.middleware import context, setup_middleware, HeaderKeys
+from skill_sdk.middleware.log import TraceIdPlugin
+
+
+def test_header_plugins():
+    assert TraceIdPlugin.raw_key == b"x-b3-traceid"
+
+    app = FastAPI()
+    setup_middleware(app)
+
+    @app.get("/")
+    def root():
+        return dict(context.data)
+
+    response = TestClient(app).get(
+        "/", headers={"x-b3-traceid": "trace-id", "X-Testing": "1"}
+    )
+    assert response.json() == {
+        HeaderKeys.trace_id: "trace-id",
+        HeaderKeys.span_id: None,
+        HeaderKeys.tenant_id: None,
+        HeaderKeys.testing_flag: "1",
+        HeaderKeys.user_debug_log: None,
+    }
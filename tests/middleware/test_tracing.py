@@ -35,3 +35,8 @@ class TestTracing(unittest.TestCase):
         decorated_func()
 
         exit_mock.assert_called_once()
+
+    def test_start_span_slots(self):
+        from skill_sdk.middleware.tracing import start_span
+
+        self.assertFalse(hasattr(start_span("test_span"), "__dict__"))
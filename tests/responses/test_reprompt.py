@@ -13,36 +13,37 @@ from skill_sdk.responses import Response, Reprompt, ResponseType
 from skill_sdk.intents import request
 
 
-def test_reprompt_response(monkeypatch):
+def test_reprompt_response():
     from skill_sdk.util import test_request
 
+    reprompt = Reprompt("abc123")
+    reprompt_stop = Reprompt("abc123", "321cba", 2)
+    reprompt_entity = Reprompt("abc123", entity="Time")
+
     with test_request("SMALLTALK__GREETINGS"):
-        assert isinstance(Reprompt("abc123"), Response)
+        assert isinstance(reprompt, Response)
 
-        response = Reprompt("abc123").dict()
+        response = reprompt.dict()
         assert response["text"] == "abc123"
         assert response["type"] == ResponseType.ASK
         assert request.session["SMALLTALK__GREETINGS_reprompt_count"] == 1
 
-        response = Reprompt("abc123").dict()
+        response = reprompt.dict()
         assert response["text"] == "abc123"
         assert response["type"] == ResponseType.ASK
         assert request.session["SMALLTALK__GREETINGS_reprompt_count"] == 2
 
-        response = Reprompt("abc123", "321cba", 2).dict()
+        response = reprompt_stop.dict()
         assert response["text"] == "321cba"
         assert response["type"] == ResponseType.TELL
         assert "SMALLTALK_GREETINGS_reprompt_count" not in request.session
 
-        monkeypatch.setitem(
-            request.session.attributes,
-            "SMALLTALK__GREETINGS_reprompt_count",
-            "not a number",
-        )
-        Reprompt("abc123").dict()
+        # Session is a deep copy owned by this request: mutate it directly
+        request.session["SMALLTALK__GREETINGS_reprompt_count"] = "not a number"
+        reprompt.dict()
         assert request.session["SMALLTALK__GREETINGS_reprompt_count"] == 1
 
-        Reprompt("abc123", entity="Time").dict()
+        reprompt_entity.dict()
         assert request.session["SMALLTALK__GREETINGS_Time_reprompt_count"] == 1
 
         attributes = request.session.attributes
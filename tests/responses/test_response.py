@@ -8,8 +8,7 @@
 #
 #
 
-import unittest
-from pydantic import ValidationError
+import pytest
 
 from skill_sdk.responses import (
     ask,
@@ -21,177 +20,197 @@ from skill_sdk.responses import (
     Response,
     ResponseType,
 )
-from skill_sdk.util import create_context
 from skill_sdk.responses.task import ClientTask
 
+EXPECTED_SIMPLE = {"text": "abc123", "type": "TELL"}
 
-class TestResponse(unittest.TestCase):
-    def setUp(self):
-        self.simple_response = Response("abc123", ResponseType.TELL)
-        self.ask_response = Response("abc123", ResponseType.ASK)
-        c = Card("SIMPLE", title_text="cardtitle", text="cardtext")
-        self.card_response = Response(
-            "abc123", ResponseType.TELL, card=c, result={"code": 22}
-        )
-        self.ctx = create_context("TELEKOM_Clock_GetTime")
-
-    def test_init_text(self):
-        self.assertEqual(self.simple_response.text, "abc123")
-        self.assertEqual(self.simple_response.type, "TELL")
-
-    def test_init_full(self):
-        self.assertEqual(self.card_response.text, "abc123")
-        self.assertEqual(self.card_response.type, "TELL")
-        self.assertEqual(self.card_response.card.title_text, "cardtitle")
-        self.assertEqual(self.card_response.result.data["code"], 22)
-        self.assertEqual(self.card_response.push_notification, None)
-
-    def test_init_bad_type(self):
-        with self.assertRaises(ValueError):
-            Response("abc123", "TEL")
-
-    def test_dict_ask(self):
-        response = self.ask_response.dict()
-        self.assertEqual("abc123", response["text"])
-        self.assertEqual("ASK", response["type"])
-
-    def test_dict_simple(self):
-        response = self.simple_response.dict()
-        self.assertEqual("abc123", response["text"])
-        self.assertEqual("TELL", response["type"])
-        self.assertNotIn("pushNotification", response)
-
-    def test_dict_card(self):
-        response = self.card_response.dict()
-        self.assertEqual(response["text"], "abc123")
-        self.assertEqual(response["type"], "TELL")
-        self.assertEqual(response["card"]["data"]["titleText"], "cardtitle")
-        self.assertEqual(response["result"]["data"]["code"], 22)
-
-    def test_response_with_card(self):
-        response = (
-            tell("Hola")
-            .with_card(
-                title_text="Title",
-                text="Text",
-                action=CardAction.INTERNAL_RESPONSE_TEXT,
-            )
-            .dict()
-        )
+EXPECTED_ASK = {"text": "abc123", "type": "ASK"}
 
-        self.assertEqual(
-            {
-                "type": "TELL",
-                "text": "Hola",
-                "card": {
-                    "type": "GENERIC_DEFAULT",
-                    "version": 1,
-                    "data": {
-                        "titleText": "Title",
-                        "text": "Text",
-                        "action": "internal://showResponseText",
-                    },
-                },
-            },
-            response,
-        )
+EXPECTED_CARD_RESPONSE = {
+    "text": "abc123",
+    "type": "TELL",
+    "card": {
+        "type": "GENERIC_DEFAULT",
+        "version": 1,
+        "data": {"titleText": "cardtitle", "text": "cardtext"},
+    },
+    "result": {"data": {"code": 22}, "local": True},
+}
 
-    def test_response_with_command(self):
-        response = tell("Hola").with_command(AudioPlayer.play_stream("URL")).dict()
-        self.assertEqual(
-            {
-                "text": "Hola",
-                "type": "TELL",
-                "result": {
-                    "data": {
-                        "use_kit": {
-                            "kit_name": "audio_player",
-                            "action": "play_stream",
-                            "parameters": {"url": "URL"},
-                        }
-                    },
-                    "local": True,
-                },
-            },
-            response,
-        )
+EXPECTED_PUSH_NOTIFICATION = {
+    "text": "abc123",
+    "type": "TELL",
+    "pushNotification": {"messagePayload": "payload", "targetName": "device"},
+}
 
-    def test_response_with_session(self):
-        response = ask("Hola?").with_session(
-            attr1="attr-1",
-            attr2="attr-2",
+EXPECTED_RESPONSE_WITH_CARD = {
+    "type": "TELL",
+    "text": "Hola",
+    "card": {
+        "type": "GENERIC_DEFAULT",
+        "version": 1,
+        "data": {
+            "titleText": "Title",
+            "text": "Text",
+            "action": "internal://showResponseText",
+        },
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def simple_response():
+    return Response("abc123", ResponseType.TELL)
+
+
+@pytest.fixture(scope="module")
+def ask_response():
+    return Response("abc123", ResponseType.ASK)
+
+
+@pytest.fixture(scope="module")
+def simple_card():
+    return Card("SIMPLE", title_text="cardtitle", text="cardtext")
+
+
+@pytest.fixture(scope="module")
+def card_response(simple_card):
+    return Response("abc123", ResponseType.TELL, card=simple_card, result={"code": 22})
+
+
+def test_init_text(simple_response):
+    assert simple_response.text == "abc123"
+    assert simple_response.type == "TELL"
+
+
+def test_init_full(card_response, simple_card):
+    assert card_response.text == "abc123"
+    assert card_response.type == "TELL"
+    assert card_response.card == simple_card
+    assert card_response.card.title_text == "cardtitle"
+    assert card_response.result.data["code"] == 22
+    assert card_response.push_notification is None
+
+
+def test_init_bad_type():
+    with pytest.raises(ValueError):
+        Response("abc123", "TEL")
+
+
+def test_dict_ask(ask_response):
+    assert ask_response.dict() == EXPECTED_ASK
+
+
+def test_dict_simple(simple_response):
+    assert simple_response.dict() == EXPECTED_SIMPLE
+
+
+def test_dict_card(card_response):
+    assert card_response.dict() == EXPECTED_CARD_RESPONSE
+
+
+def test_response_with_card():
+    response = (
+        tell("Hola")
+        .with_card(
+            title_text="Title",
+            text="Text",
+            action=CardAction.INTERNAL_RESPONSE_TEXT,
         )
-        self.assertEqual(
-            {
-                "text": "Hola?",
-                "type": "ASK",
-                "session": {"attributes": {"attr1": "attr-1", "attr2": "attr-2"}},
+        .dict()
+    )
+
+    assert response == EXPECTED_RESPONSE_WITH_CARD
+
+
+def test_response_with_command():
+    response = tell("Hola").with_command(AudioPlayer.play_stream("URL")).dict()
+    assert response == {
+        "text": "Hola",
+        "type": "TELL",
+        "result": {
+            "data": {
+                "use_kit": {
+                    "kit_name": "audio_player",
+                    "action": "play_stream",
+                    "parameters": {"url": "URL"},
+                }
             },
-            response.dict(),
+            "local": True,
+        },
+    }
+
+
+def test_response_with_session():
+    response = ask("Hola?").with_session(
+        attr1="attr-1",
+        attr2="attr-2",
+    )
+    assert response.dict() == {
+        "text": "Hola?",
+        "type": "ASK",
+        "session": {"attributes": {"attr1": "attr-1", "attr2": "attr-2"}},
+    }
+    with pytest.raises(ValueError):
+        tell("Hola").with_session(
+            attr1="attr-1",
+            attr2="attr-2",
         )
-        with self.assertRaises(ValueError):
-            tell("Hola").with_session(
-                attr1="attr-1",
-                attr2="attr-2",
-            )
-
-    def test_response_with_task(self):
-        response = tell("Hola").with_task(ClientTask.invoke("WEATHER__INTENT"))
-        self.assertEqual(
-            {
-                "type": "TELL",
-                "text": "Hola",
-                "result": {
-                    "data": {},
-                    "local": True,
-                    "delayedClientTask": {
-                        "invokeData": {"intent": "WEATHER__INTENT", "parameters": {}},
-                        "executionTime": {
-                            "executeAfter": {
-                                "reference": "SPEECH_END",
-                                "offset": "P0D",
-                            }
-                        },
-                    },
+
+
+def test_response_with_task():
+    response = tell("Hola").with_task(ClientTask.invoke("WEATHER__INTENT"))
+    assert response.dict() == {
+        "type": "TELL",
+        "text": "Hola",
+        "result": {
+            "data": {},
+            "local": True,
+            "delayedClientTask": {
+                "invokeData": {"intent": "WEATHER__INTENT", "parameters": {}},
+                "executionTime": {
+                    "executeAfter": {
+                        "reference": "SPEECH_END",
+                        "offset": "P0D",
+                    }
                 },
             },
-            response.dict(),
-        )
+        },
+    }
+
+
+def test_tell():
+    r = tell("Hello")
+    assert isinstance(r, Response)
+    assert r.type == "TELL"
+
+
+def test_ask():
+    r = ask("Question")
+    assert isinstance(r, Response)
+    assert r.type == "ASK"
 
-    def test_tell(self):
-        r = tell("Hello")
-        self.assertIsInstance(r, Response)
-        self.assertEqual("TELL", r.type)
-
-    def test_ask(self):
-        r = ask("Question")
-        self.assertIsInstance(r, Response)
-        self.assertEqual("ASK", r.type)
-
-    def test_ask_freetext(self):
-        r = ask_freetext("Question")
-        self.assertIsInstance(r, Response)
-        self.assertEqual("ASK_FREETEXT", r.type)
-
-    def test_init_push_notification(self):
-        response = self.simple_response.with_notification(
-            target_name="device", message_payload="payload"
-        ).dict()
-        self.assertEqual("abc123", response["text"])
-        self.assertEqual("TELL", response["type"])
-        self.assertEqual(
-            {"messagePayload": "payload", "targetName": "device"},
-            response["pushNotification"],
-        )
 
-    #
-    # TODO: double check if this functionality requested by skills, remove if not needed
-    #
-    """
-    def test_message(self):
-        response = Response(Message('{abc}123', 'KEY', abc='abc')).dict()
-        self.assertEqual('abc123', response['text'])
-        self.assertEqual(ResponseType.TELL, response['type'])
-        self.assertEqual({'key': 'KEY', 'value': '{abc}123', 'args': (), 'kwargs': {'abc': 'abc'}},
-                         response['result']['data'])
-    """
+def test_ask_freetext():
+    r = ask_freetext("Question")
+    assert isinstance(r, Response)
+    assert r.type == "ASK_FREETEXT"
+
+
+def test_init_push_notification(simple_response):
+    response = simple_response.with_notification(
+        target_name="device", message_payload="payload"
+    ).dict()
+    assert response == EXPECTED_PUSH_NOTIFICATION
+
+
+#
+# TODO: double check if this functionality requested by skills, remove if not needed
+#
+"""
+def test_message():
+    response = Response(Message('{abc}123', 'KEY', abc='abc')).dict()
+    assert response['text'] == 'abc123'
+    assert response['type'] == ResponseType.TELL
+    assert response['result']['data'] == {'key': 'KEY', 'value': '{abc}123', 'args': (), 'kwargs': {'abc': 'abc'}}
+"""
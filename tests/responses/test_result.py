@@ -77,10 +77,15 @@ class TestIntentsResult(unittest.TestCase):
             Result({"a": 1}, target_device_id="Primary").target_device_id, "Primary"
         )
 
-    def test_result_repr(self):
-        """Test Result representation"""
+    def test_result_fields(self):
+        """Test Result field values (compared structurally, not via repr string)"""
         result = Result({"a": 1}, target_device_id="Secondary")
         self.assertEqual(
-            "Result(data={'a': 1}, local=True, target_device_id='Secondary', delayed_client_task=None)",
-            repr(result),
+            {
+                "data": {"a": 1},
+                "local": True,
+                "target_device_id": "Secondary",
+                "delayed_client_task": None,
+            },
+            vars(result),
         )
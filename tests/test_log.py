@@ -8,10 +8,13 @@
 #
 #
 
+import os
 import json
 import logging
 from logging import makeLogRecord, INFO
 from unittest.mock import patch
+
+import pytest
 from fastapi import Request
 from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
@@ -56,6 +59,12 @@ def test_log_record():
     assert [
         v for k, v in resp.json().items() if k in ("traceId", "spanId", "tenant")
     ] == expected
+    assert resp.json()["process"] == os.getpid()
+
+
+def test_log_record_surrogates():
+    record = makeLogRecord({"msg": b"\xff".decode(errors="surrogateescape")})
+    assert json.loads(log.CloudGELFFormatter().format(record))["message"] == "\udcff"
 
 
 def test_user_log():
@@ -73,3 +82,53 @@ def test_user_log():
             },
         )
         mock_debug.assert_called_once_with(10, "Debug message", ())
+
+
+def test_tracing_headers():
+    from starlette_context import request_cycle_context
+    from skill_sdk.middleware import HeaderKeys
+
+    assert log.tracing_headers() is log.NO_TRACING_HEADERS
+
+    with request_cycle_context(
+        {HeaderKeys.trace_id: "trace-id", HeaderKeys.span_id: None}
+    ):
+        assert log.tracing_headers() == {HeaderKeys.trace_id: "trace-id"}
+
+
+def test_prepare_for_logging(monkeypatch):
+    from skill_sdk.config import settings
+
+    monkeypatch.setattr(settings, "LOG_ENTRY_MAX_STRING", 5)
+
+    record = {"short": "abc", "list": ("abc", 1)}
+    assert log.prepare_for_logging(record) is record
+
+    record = {"long": "abcdefgh", "nested": {"list": ("abc", "abcdefgh")}}
+    assert log.prepare_for_logging(record) == {
+        "long": "abcde...",
+        "nested": {"list": ["abc", "abcde..."]},
+    }
+
+
+def test_setup_logging():
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+
+    try:
+        log.setup_logging(logging.INFO, "gelf")
+        assert len(root.handlers) == 1 and root.level == logging.INFO
+        assert isinstance(root.handlers[0].formatter, log.CloudGELFFormatter)
+
+        replaced = root.handlers[0]
+        with patch.object(replaced, "close") as close:
+            log.setup_logging(logging.ERROR, "human")
+            close.assert_called_once()
+        assert len(root.handlers) == 1 and root.level == logging.ERROR
+        assert root.handlers[0].formatter._fmt == log.HUMAN_FORMAT
+
+        with pytest.raises(RuntimeError):
+            log.setup_logging(logging.INFO, "unknown")
+    finally:
+        root.handlers[:] = handlers
+        root.setLevel(level)
@@ -116,3 +116,37 @@ async def test_circuit_breaker():
             c.get(LOCALHOST)
         assert c.circuit_breaker.state.state == CircuitBreakerState.CLOSED
         assert route.called
+
+
+@respx.mock
+def test_internal_request_tracing_headers():
+    from starlette_context import request_cycle_context
+    from skill_sdk.middleware import HeaderKeys
+
+    route = respx.get(LOCALHOST).mock()
+    with Client(internal=True) as c:
+        headers = {"X-Custom": "value"}
+        c.get(LOCALHOST, headers=headers)
+        assert HeaderKeys.trace_id not in route.calls.last.request.headers
+
+        with request_cycle_context({HeaderKeys.trace_id: "trace-id"}):
+            c.get(LOCALHOST, headers=headers)
+        request = route.calls.last.request
+        assert request.headers[HeaderKeys.trace_id] == "trace-id"
+        assert request.headers["X-Custom"] == "value"
+        assert headers == {"X-Custom": "value"}
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_internal_request_headers_list():
+    from starlette_context import request_cycle_context
+    from skill_sdk.middleware import HeaderKeys
+
+    route = respx.get(LOCALHOST).mock()
+    async with AsyncClient(internal=True) as c:
+        with request_cycle_context({HeaderKeys.trace_id: "trace-id"}):
+            await c.get(LOCALHOST, headers=[("x-b3-traceid", "old"), ("X-Custom", "1")])
+        request = route.calls.last.request
+        assert request.headers.get_list(HeaderKeys.trace_id) == ["trace-id"]
+        assert request.headers["X-Custom"] == "1"
@@ -27,6 +27,8 @@ SKILL_INFO = {
     "skillSpiVersion": __spi_version__,
 }
 
+TEST_INTENT_REQUEST = create_request("Test_Intent", session={}).json()
+
 
 class TestRoutes(unittest.TestCase):
     def setUp(self) -> None:
@@ -67,6 +69,14 @@ class TestRoutes(unittest.TestCase):
         assert response.status_code == 404
         assert response.json() == {"code": 1, "text": "Intent not found!"}
 
+    def test_invoke_invalid_json(self):
+        response = self.client.post(
+            ENDPOINT,
+            data=b'{"context": ',
+            headers={**self.auth, "Content-Type": "application/json"},
+        )
+        assert response.status_code == 422
+
     def test_invoke_response_tell(self):
         def handler():
             from skill_sdk.intents.request import r
@@ -78,7 +88,7 @@ class TestRoutes(unittest.TestCase):
 
         response = self.client.post(
             ENDPOINT,
-            data=create_request("Test_Intent", session={}).json(),
+            data=TEST_INTENT_REQUEST,
             headers=self.auth,
         )
         assert response.status_code == 200
@@ -97,7 +107,7 @@ class TestRoutes(unittest.TestCase):
 
         response = self.client.post(
             ENDPOINT,
-            data=create_request("Test_Intent", session={}).json(),
+            data=TEST_INTENT_REQUEST,
             headers=self.auth,
         )
         assert response.status_code == 200
@@ -106,3 +116,15 @@ class TestRoutes(unittest.TestCase):
             "type": "ASK",
             "session": {"attributes": {"Session Key": "Hello"}},
         }
+
+    def test_get_translation(self):
+        from skill_sdk import i18n
+        from skill_sdk.routes import _get_translation
+
+        de = i18n.Translations("de")
+        self.app.translations = {"de": de}
+        assert _get_translation(self.app, "de") is de
+
+        fallback = _get_translation(self.app, "fr")
+        assert isinstance(fallback, i18n.Translations)
+        assert _get_translation(self.app, "en") is fallback
@@ -37,6 +37,89 @@ def test_intent_handlers():
             app.include("Another_Test_Intent", handler="Hola")  # noqa
 
 
+def test_get_intent():
+    app = skill.init_app()
+
+    with closing(app):
+        app.include("Test_Intent", handler=lambda: "Hola")
+        assert app.get_intent("Test_Intent") is app.intents["Test_Intent"]
+        assert app.get_intent("Another_Test_Intent") is None
+
+        app.include(skill.FALLBACK_INTENT, handler=lambda: "Fallback")
+        assert app.get_intent("Test_Intent") is app.intents["Test_Intent"]
+        fallback = app.intents[skill.FALLBACK_INTENT]
+        assert app.get_intent("Another_Test_Intent") is fallback
+
+
+def test_include_registered_handler():
+    app = skill.init_app()
+
+    with closing(app):
+
+        @app.intent_handler("Test_Intent")
+        def handler():
+            return "Hola"
+
+        # Already registered handler is not added again
+        app.include("Another_Test_Intent", handler=handler)
+        assert list(app.intents) == ["Test_Intent"]
+
+    # Cleared on close
+    with closing(skill.init_app()) as app:
+        app.include("Another_Test_Intent", handler=handler)
+        assert list(app.intents) == ["Another_Test_Intent"]
+
+
+def test_handler_wrapped_once():
+    app = skill.init_app()
+
+    with closing(app):
+
+        def handler():
+            return "Hola"
+
+        app.intent_handler("Test_Intent")(handler)
+        app.intent_handler("Another_Test_Intent")(handler)
+        assert app.intents["Test_Intent"] is app.intents["Another_Test_Intent"]
+
+
+def test_unhashable_error_handler():
+    from dataclasses import dataclass
+
+    @dataclass
+    class ErrorHandler:
+        text: str = "Error"
+
+        def __call__(self, name, exc):
+            return self.text
+
+    app = skill.init_app()
+
+    with closing(app):
+        app.include("Test_Intent", handler=lambda: "Hola", error_handler=ErrorHandler())
+        assert "Test_Intent" in app.intents
+
+
+def test_intent_examples_populated_lazily():
+    from skill_sdk.intents import Context
+
+    app = skill.init_app()
+
+    with closing(app):
+        app.include("Test_Intent", handler=lambda: "Hola")
+        app.openapi()
+
+        examples = Context.__config__.schema_extra["examples"]
+        assert [_["summary"] for _ in examples.values()] == ["Test_Intent"]
+
+
+def test_prometheus_lookup_cached():
+    skill._prometheus_setup.cache_clear()
+
+    with closing(skill.init_app()), closing(skill.init_app()):
+        assert skill._prometheus_setup.cache_info().misses == 1
+
+
 @pytest.mark.asyncio
 async def test_with_error_handler():
     app = skill.init_app()
@@ -81,3 +164,11 @@ def test_sync_test_intent():
 
         assert result.text == "Hola"
         assert result.type == ResponseType.TELL
+
+        # Helper app is created once and shares the intents with other instances
+        assert skill.test_intent("Test_Intent").text == "Hola"
+        assert skill._test_app.cache_info().currsize == 1
+        assert skill._test_app().intents is app.intents
+
+        # ... without FastAPI routes/OpenAPI scaffolding
+        assert not hasattr(skill._test_app(), "router")
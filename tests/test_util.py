@@ -73,3 +73,36 @@ async def test_run_sync_from_async():
     assert await async_sleep()
     # This would raise "RuntimeError: This event loop is already running"
     assert run_until_complete(async_sleep())
+
+
+def test_run_in_executor_context():
+    from contextvars import ContextVar
+    from skill_sdk.util import run_in_executor, run_until_complete
+
+    var: ContextVar = ContextVar("var", default=None)
+
+    async def run(value):
+        var.set(value)
+        return await run_in_executor(var.get)
+
+    assert [run_until_complete(run(value)) for value in range(3)] == [0, 1, 2]
+    assert var.get() is None
+
+
+def test_run_in_executor_max_workers(monkeypatch):
+    import time
+    from skill_sdk import util
+    from skill_sdk.config import settings
+
+    monkeypatch.setattr(util, "_executor", None)
+    monkeypatch.setattr(settings, "EXECUTOR_MAX_WORKERS", 20)
+
+    async def run():
+        return await asyncio.gather(
+            *(util.run_in_executor(time.sleep, 0.1) for _ in range(20))
+        )
+
+    start = time.monotonic()
+    util.run_until_complete(run())
+    assert time.monotonic() - start < 0.3
+    assert util._executor._max_workers == 20